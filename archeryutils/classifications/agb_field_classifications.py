@@ -8,6 +8,8 @@ calculate_agb_field_classification
 agb_field_classification_scores
 """
 
+import bisect
+import functools
 import itertools
 from typing import Any, TypedDict
 
@@ -223,10 +225,11 @@ def calculate_agb_field_classification(
 
     """
     # Check score is valid
-    if score < 0 or score > ALL_FIELD_ROUNDS[roundname].max_score():
+    round_max_score = ALL_FIELD_ROUNDS[roundname].max_score()
+    if score < 0 or score > round_max_score:
         msg = (
             f"Invalid score of {score} for a {roundname}. "
-            f"Should be in range 0-{ALL_FIELD_ROUNDS[roundname].max_score()}."
+            f"Should be in range 0-{round_max_score}."
         )
         raise ValueError(msg)
 
@@ -238,8 +241,51 @@ def calculate_agb_field_classification(
     if age_group.lower().replace(" ", "") in ("under21"):
         age_group = "Adult"
 
+    # Get the eligible classification thresholds for this round and category
+    cutoffs, class_names = _classification_cutoffs(
+        roundname,
+        bowstyle,
+        gender,
+        age_group,
+    )
+
+    # What is the highest classification this score gets?
+    # Thresholds are ascending, so count how many this score meets or exceeds
+    n_achieved = bisect.bisect_right(cutoffs, score)
+    if n_achieved:
+        return class_names[n_achieved - 1]
+    return "UC"
+
+
+@functools.lru_cache(maxsize=None)
+def _classification_cutoffs(
+    roundname: str, bowstyle: str, gender: str, age_group: str
+) -> tuple[tuple[int, ...], tuple[str, ...]]:
+    """
+    Get the scores required for each eligible classification on a round.
+
+    Results are cached as they are constant for a given round and category.
+
+    Parameters
+    ----------
+    roundname : str
+        name of round shot as given by 'codename' in json
+    bowstyle : str
+        archer's bowstyle under AGB field target rules
+    gender : str
+        archer's gender under AGB field target rules
+    age_group : str
+        archer's age group under AGB field target rules
+
+    Returns
+    -------
+    cutoffs : tuple of int
+        minimum score for each eligible classification in ascending order
+    class_names : tuple of str
+        abbreviation of the classification matching each entry in cutoffs
+    """
     # Get scores required on this round for each classification
-    all_class_scores = agb_field_classification_scores(
+    all_class_scores = _classification_scores(
         roundname,
         bowstyle,
         gender,
@@ -248,16 +294,19 @@ def calculate_agb_field_classification(
 
     groupname = cls_funcs.get_groupname(bowstyle, gender, age_group)
     group_data = agb_field_classifications[groupname]
-    class_data = dict(zip(group_data["classes"], all_class_scores, strict=True))
-
-    # Of the classes remaining, what is the highest classification this score gets?
-    # < 0 handles max scores, > score handles higher classifications
-    for classname, classscore in class_data.items():
-        if classscore < 0 or classscore > score:
-            continue
-        else:
-            return classname
-    return "UC"
+    class_data = zip(group_data["classes"], all_class_scores, strict=True)
+
+    # Classes are stored highest first, so reverse for ascending score thresholds
+    # Skip any fill values (< 0) for classifications that cannot be achieved
+    eligible = [
+        (classname, classscore)
+        for classname, classscore in reversed(list(class_data))
+        if classscore >= 0
+    ]
+    cutoffs = tuple(classscore for _, classscore in eligible)
+    class_names = tuple(classname for classname, _ in eligible)
+
+    return cutoffs, class_names
 
 
 def agb_field_classification_scores(
@@ -311,6 +360,32 @@ def agb_field_classification_scores(
     ... )
     [-9999, -9999, -9999, 173, 159, 143, 124, 102, 79],
 
+    """
+    return list(_classification_scores(roundname, bowstyle, gender, age_group))
+
+
+@functools.lru_cache(maxsize=None)
+def _classification_scores(
+    roundname: str, bowstyle: str, gender: str, age_group: str
+) -> tuple[int, ...]:
+    """
+    Calculate and cache AGB field classification scores for category.
+
+    Parameters
+    ----------
+    roundname : str
+        name of round shot as given by 'codename' in json
+    bowstyle : str
+        archer's bowstyle under AGB field target rules
+    gender : str
+        archer's gender under AGB field target rules
+    age_group : str
+        archer's age group under AGB field target rules
+
+    Returns
+    -------
+    classification_scores : tuple of int
+        scores required for each classification in descending order
     """
     # No under 21 category in field, use adult scores
     if age_group.lower().replace(" ", "") in ("under21"):
@@ -353,6 +428,4 @@ def agb_field_classification_scores(
 
     # Score threshold should be int (score_for_round called with round=True)
     # Enforce this for better code and to satisfy mypy
-    int_class_scores = [int(x) for x in class_scores]
-
-    return int_class_scores
+    return tuple(int(x) for x in class_scores)
@@ -7,6 +7,7 @@ calculate_agb_indoor_classification
 agb_indoor_classification_scores
 """
 
+import functools
 import itertools
 from typing import TypedDict
 
@@ -170,16 +171,17 @@ def calculate_agb_indoor_classification(
 
     """
     # Check score is valid
-    if score < 0 or score > ALL_INDOOR_ROUNDS[roundname].max_score():
+    round_max_score = ALL_INDOOR_ROUNDS[roundname].max_score()
+    if score < 0 or score > round_max_score:
         msg = (
             f"Invalid score of {score} for a {roundname}. "
-            f"Should be in range 0-{ALL_INDOOR_ROUNDS[roundname].max_score()}."
+            f"Should be in range 0-{round_max_score}."
         )
         raise ValueError(msg)
 
     # Get scores required on this round for each classification
     # Enforcing full size face and compound scoring (for compounds)
-    all_class_scores = agb_indoor_classification_scores(
+    all_class_scores = _classification_scores(
         roundname,
         bowstyle,
         gender,
@@ -254,6 +256,35 @@ def agb_indoor_classification_scores(
     ... )
     [-9999, -9999, 298, 289, 276, 257, 233, 200]
 
+    """
+    return list(_classification_scores(roundname, bowstyle, gender, age_group))
+
+
+@functools.lru_cache(maxsize=None)
+def _classification_scores(
+    roundname: str,
+    bowstyle: str,
+    gender: str,
+    age_group: str,
+) -> tuple[int, ...]:
+    """
+    Calculate and cache 2023 AGB indoor classification scores for category.
+
+    Parameters
+    ----------
+    roundname : str
+        name of round shot as given by 'codename' in json
+    bowstyle : str
+        archer's bowstyle under AGB outdoor target rules
+    gender : str
+        archer's gender under AGB outdoor target rules
+    age_group : str
+        archer's age group under AGB outdoor target rules
+
+    Returns
+    -------
+    classification_scores : tuple of int
+        scores required for each classification in descending order
     """
     # deal with reduced categories:
     if bowstyle.lower() in ("flatbow", "traditional", "asiatic"):
@@ -306,4 +337,4 @@ def agb_indoor_classification_scores(
             else:
                 int_class_scores[i] += 1
 
-    return int_class_scores
+    return tuple(int_class_scores)
@@ -168,10 +168,11 @@ def calculate_agb_old_field_classification(
 
     """
     # Check score is valid
-    if score < 0 or score > ALL_AGBFIELD_ROUNDS[roundname].max_score():
+    round_max_score = ALL_AGBFIELD_ROUNDS[roundname].max_score()
+    if score < 0 or score > round_max_score:
         msg = (
             f"Invalid score of {score} for a {roundname}. "
-            f"Should be in range 0-{ALL_AGBFIELD_ROUNDS[roundname].max_score()}."
+            f"Should be in range 0-{round_max_score}."
         )
         raise ValueError(msg)
 
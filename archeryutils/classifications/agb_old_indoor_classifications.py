@@ -7,6 +7,7 @@ calculate_AGB_old_indoor_classification
 AGB_old_indoor_classification_scores
 """
 
+import functools
 from typing import TypedDict
 
 import archeryutils.classifications.classification_utils as cls_funcs
@@ -136,15 +137,16 @@ def calculate_agb_old_indoor_classification(
 
     """
     # Check score is valid
-    if score < 0 or score > ALL_INDOOR_ROUNDS[roundname].max_score():
+    round_max_score = ALL_INDOOR_ROUNDS[roundname].max_score()
+    if score < 0 or score > round_max_score:
         msg = (
             f"Invalid score of {score} for a {roundname}. "
-            f"Should be in range 0-{ALL_INDOOR_ROUNDS[roundname].max_score()}."
+            f"Should be in range 0-{round_max_score}."
         )
         raise ValueError(msg)
 
     # Get scores required on this round for each classification
-    class_scores = agb_old_indoor_classification_scores(
+    class_scores = _classification_scores(
         roundname,
         bowstyle,
         gender,
@@ -212,6 +214,35 @@ def agb_old_indoor_classification_scores(
     [592, 582, 554, 505, 432, 315, 195, 139]
 
 
+    """
+    return list(_classification_scores(roundname, bowstyle, gender, age_group))
+
+
+@functools.lru_cache(maxsize=None)
+def _classification_scores(
+    roundname: str,
+    bowstyle: str,
+    gender: str,
+    age_group: str,
+) -> tuple[int, ...]:
+    """
+    Calculate and cache old AGB indoor classification scores for category.
+
+    Parameters
+    ----------
+    roundname : str
+        name of round shot as given by 'codename' in json
+    bowstyle : str
+        archer's bowstyle under AGB outdoor target rules
+    gender : str
+        archer's gender under AGB outdoor target rules
+    age_group : str
+        archer's age group under AGB outdoor target rules
+
+    Returns
+    -------
+    classification_scores : tuple of int
+        scores required for each classification in descending order
     """
     # enforce compound scoring
     if bowstyle.lower() in ("compound"):
@@ -238,6 +269,4 @@ def agb_old_indoor_classification_scores(
 
     # Score threshold should be int (score_for_round called with round=True)
     # Enforce this for better code and to satisfy mypy
-    int_class_scores = [int(x) for x in class_scores]
-
-    return int_class_scores
+    return tuple(int(x) for x in class_scores)
@@ -7,6 +7,8 @@ calculate_agb_outdoor_classification
 agb_outdoor_classification_scores
 """
 
+import bisect
+import functools
 import itertools
 from typing import Any, Literal, TypedDict, cast
 
@@ -304,8 +306,10 @@ def _assign_outdoor_prestige(
     distance_check = distance_check + prestige_metric
 
     # Check all other rounds based on distance
+    # Category distance is fixed, so find it once rather than for every round
+    category_dist = np.min(max_dist)
     for roundname in distance_check:
-        if ALL_OUTDOOR_ROUNDS[roundname].max_distance().value >= np.min(max_dist):
+        if ALL_OUTDOOR_ROUNDS[roundname].max_distance().value >= category_dist:
             prestige_rounds.append(roundname)
 
     return prestige_rounds
@@ -371,22 +375,76 @@ def calculate_agb_outdoor_classification(
 
     """
     # Check score is valid
-    if score < 0 or score > ALL_OUTDOOR_ROUNDS[roundname].max_score():
+    round_max_score = ALL_OUTDOOR_ROUNDS[roundname].max_score()
+    if score < 0 or score > round_max_score:
         msg = (
             f"Invalid score of {score} for a {roundname}. "
-            f"Should be in range 0-{ALL_OUTDOOR_ROUNDS[roundname].max_score()}.",
+            f"Should be in range 0-{round_max_score}."
         )
         raise ValueError(msg)
 
+    # Get the eligible classification thresholds for this round and category
+    cutoffs, class_names = _classification_cutoffs(
+        roundname,
+        bowstyle,
+        gender,
+        age_group,
+    )
+
+    # Of the classes remaining, what is the highest classification this score gets?
+    # Thresholds are ascending, so count how many this score meets or exceeds
+    n_achieved = bisect.bisect_right(cutoffs, score)
+    if n_achieved:
+        return class_names[n_achieved - 1]
+    return "UC"
+
+
+@functools.lru_cache(maxsize=None)
+def _classification_cutoffs(
+    roundname: str,
+    bowstyle: str,
+    gender: str,
+    age_group: str,
+) -> tuple[tuple[int, ...], tuple[str, ...]]:
+    """
+    Get the scores required for each eligible classification on a round.
+
+    Results are cached as they are constant for a given round and category.
+
+    Parameters
+    ----------
+    roundname : str
+        name of round shot as given by 'codename' in json
+    bowstyle : str
+        archer's bowstyle under AGB outdoor target rules
+    gender : str
+        archer's gender under AGB outdoor target rules
+    age_group : str
+        archer's age group under AGB outdoor target rules
+
+    Returns
+    -------
+    cutoffs : tuple of int
+        minimum score for each eligible classification in ascending order
+    class_names : tuple of str
+        abbreviation of the classification matching each entry in cutoffs
+
+    References
+    ----------
+    ArcheryGB 2023 Rules of Shooting
+    ArcheryGB Shooting Administrative Procedures - SAP7 (2023)
+    """
     # Get scores required on this round for each classification
     # Enforcing full size face and compound scoring (for compounds)
-    all_class_scores = agb_outdoor_classification_scores(
+    all_class_scores = _classification_scores(
         roundname,
         bowstyle,
         gender,
         age_group,
     )
 
+    # Use the same category as the scores so prestige and distances match them
+    bowstyle = _scoring_bowstyle(bowstyle)
     groupname = cls_funcs.get_groupname(bowstyle, gender, age_group)
     group_data = agb_outdoor_classifications[groupname]
 
@@ -402,14 +460,17 @@ def calculate_agb_outdoor_classification(
     # remove ineligible classes from class_data
     class_data = _check_prestige_distance(roundname, groupname, class_data)
 
-    # Of the classes remaining, what is the highest classification this score gets?
-    # < 0 handles max scores, > score handles higher classifications
-    for classname, classdata in class_data.items():
-        if classdata["score"] > score:
-            continue
-        else:
-            return classname
-    return "UC"
+    # Classes are stored highest first, so reverse for ascending score thresholds
+    # Skip any fill values (< 0) for classifications that cannot be achieved
+    eligible = [
+        (classname, classdata)
+        for classname, classdata in reversed(class_data.items())
+        if classdata["score"] >= 0
+    ]
+    cutoffs = tuple(classdata["score"] for _, classdata in eligible)
+    class_names = tuple(classname for classname, _ in eligible)
+
+    return cutoffs, class_names
 
 
 def _check_prestige_distance(
@@ -459,6 +520,27 @@ def _check_prestige_distance(
     return class_data
 
 
+def _scoring_bowstyle(bowstyle: str) -> str:
+    """
+    Get the bowstyle whose outdoor classifications apply to a given bowstyle.
+
+    Parameters
+    ----------
+    bowstyle : str
+        archer's bowstyle under AGB outdoor target rules
+
+    Returns
+    -------
+    bowstyle : str
+        bowstyle to use when looking up classification data
+    """
+    if bowstyle.lower() in ("traditional", "flatbow", "asiatic"):
+        return "Barebow"
+    if bowstyle.lower() in ("compound barebow", "compound longbow"):
+        return "Compound"
+    return bowstyle
+
+
 def agb_outdoor_classification_scores(
     roundname: str,
     bowstyle: str,
@@ -514,11 +596,36 @@ def agb_outdoor_classification_scores(
     [-9999, -9999, -9999, -9999, -9999, 931, 797, 646, 493]
 
     """
-    if bowstyle.lower() in ("traditional", "flatbow", "asiatic"):
-        bowstyle = "Barebow"
-    elif bowstyle.lower() in ("compound barebow", "compound longbow"):
-        bowstyle = "Compound"
+    return list(_classification_scores(roundname, bowstyle, gender, age_group))
+
 
+@functools.lru_cache(maxsize=None)
+def _classification_scores(
+    roundname: str,
+    bowstyle: str,
+    gender: str,
+    age_group: str,
+) -> tuple[int, ...]:
+    """
+    Calculate and cache AGB outdoor classification scores for category.
+
+    Parameters
+    ----------
+    roundname : str
+        name of round shot as given by 'codename' in json
+    bowstyle : str
+        archer's bowstyle under AGB outdoor target rules
+    gender : str
+        archer's gender under AGB outdoor target rules
+    age_group : str
+        archer's age group under AGB outdoor target rules
+
+    Returns
+    -------
+    classification_scores : tuple of int
+        scores required for each classification in descending order
+    """
+    bowstyle = _scoring_bowstyle(bowstyle)
     groupname = cls_funcs.get_groupname(bowstyle, gender, age_group)
     group_data = agb_outdoor_classifications[groupname]
 
@@ -546,6 +653,4 @@ def agb_outdoor_classification_scores(
 
     # Score threshold should be int (score_for_round called with round=True)
     # Enforce this for better code and to satisfy mypy
-    int_class_scores = [int(x) for x in class_scores]
-
-    return int_class_scores
+    return tuple(int(x) for x in class_scores)
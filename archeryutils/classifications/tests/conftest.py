@@ -0,0 +1,66 @@
+"""Shared fixtures for classification tests."""
+
+import pytest
+
+from archeryutils import load_rounds
+from archeryutils.rounds import Round
+
+
+@pytest.fixture(scope="session")
+def agb_field_rounds() -> dict[str, Round]:
+    """Load the field rounds once for the whole test session."""
+    return load_rounds.read_json_to_round_dict(
+        [
+            "WA_field.json",
+        ],
+    )
+
+
+@pytest.fixture(scope="session")
+def agb_field_max_scores(agb_field_rounds: dict[str, Round]) -> dict[str, float]:
+    """Compute the maximum score for each field round once per session."""
+    return {
+        roundname: archery_round.max_score()
+        for roundname, archery_round in agb_field_rounds.items()
+    }
+
+
+@pytest.fixture(scope="session")
+def agb_indoor_rounds() -> dict[str, Round]:
+    """Load the indoor rounds once for the whole test session."""
+    return load_rounds.read_json_to_round_dict(
+        [
+            "AGB_indoor.json",
+            "WA_indoor.json",
+        ],
+    )
+
+
+@pytest.fixture(scope="session")
+def agb_indoor_max_scores(agb_indoor_rounds: dict[str, Round]) -> dict[str, float]:
+    """Compute the maximum score for each indoor round once per session."""
+    return {
+        roundname: archery_round.max_score()
+        for roundname, archery_round in agb_indoor_rounds.items()
+    }
+
+
+@pytest.fixture(scope="session")
+def agb_outdoor_rounds() -> dict[str, Round]:
+    """Load the outdoor rounds once for the whole test session."""
+    return load_rounds.read_json_to_round_dict(
+        [
+            "AGB_outdoor_imperial.json",
+            "AGB_outdoor_metric.json",
+            "WA_outdoor.json",
+        ],
+    )
+
+
+@pytest.fixture(scope="session")
+def agb_outdoor_max_scores(agb_outdoor_rounds: dict[str, Round]) -> dict[str, float]:
+    """Compute the maximum score for each outdoor round once per session."""
+    return {
+        roundname: archery_round.max_score()
+        for roundname, archery_round in agb_outdoor_rounds.items()
+    }
@@ -1,14 +1,254 @@
 """Tests for field classification functions."""
 
+from typing import Final
+
 import pytest
 
 import archeryutils.classifications as class_funcs
-from archeryutils import load_rounds
 
-ALL_AGBFIELD_ROUNDS = load_rounds.read_json_to_round_dict(
-    [
-        "WA_field.json",
-    ],
+# Expected scores shared by several cases (under 21 uses adult scores in field)
+_BAREBOW_MALE_ADULT_BLUE24: Final = (336, 311, 283, 249, 212, 173, 135, 101, 74)
+_LONGBOW_MALE_ADULT_BLUE24: Final = (241, 209, 176, 143, 114, 88, 67, 49, 36)
+
+# Check all ages, genders, and bowstyles, different distances, and large handicaps.
+_SCORES_CASES = (
+    # Ages
+    (
+        "wa_field_24_blue_marked",
+        "barebow",
+        "male",
+        "adult",
+        _BAREBOW_MALE_ADULT_BLUE24,
+    ),
+    (
+        "wa_field_24_blue_marked",
+        "barebow",
+        "male",
+        "50+",
+        (321, 294, 263, 227, 188, 149, 114, 84, 60),
+    ),
+    (
+        "wa_field_24_blue_marked",
+        "barebow",
+        "male",
+        "Under 21",
+        _BAREBOW_MALE_ADULT_BLUE24,
+    ),
+    (
+        "wa_field_24_blue_marked",
+        "barebow",
+        "male",
+        "Under 18",
+        (305, 275, 241, 203, 164, 127, 94, 68, 48),
+    ),
+    (
+        "wa_field_24_blue_marked",
+        "barebow",
+        "male",
+        "Under 12",
+        (224, 185, 146, 111, 82, 58, 41, 28, 19),
+    ),
+    # Genders
+    (
+        "wa_field_24_blue_marked",
+        "barebow",
+        "female",
+        "adult",
+        (315, 287, 255, 218, 179, 140, 106, 78, 55),
+    ),
+    (
+        "wa_field_24_blue_marked",
+        "barebow",
+        "female",
+        "Under 18",
+        (280, 247, 209, 170, 132, 99, 72, 51, 35),
+    ),
+    # Bowstyles
+    (
+        "wa_field_24_red_marked",
+        "compound",
+        "male",
+        "adult",
+        (408, 391, 369, 345, 318, 286, 248, 204, 157),
+    ),
+    (
+        "wa_field_12_red_unmarked",
+        "compound",
+        "male",
+        "adult",
+        (-9999, -9999, -9999, 173, 159, 143, 124, 102, 79),
+    ),
+    (
+        "wa_field_24_red_marked",
+        "compound limited",
+        "male",
+        "adult",
+        (369, 347, 322, 293, 259, 219, 176, 133, 96),
+    ),
+    (
+        "wa_field_24_blue_marked",
+        "compound barebow",
+        "male",
+        "adult",
+        (343, 321, 296, 268, 235, 200, 164, 129, 99),
+    ),
+    (
+        "wa_field_24_red_marked",
+        "recurve",
+        "male",
+        "adult",
+        (369, 343, 314, 279, 237, 189, 139, 96, 62),
+    ),
+    (
+        "wa_field_24_blue_marked",
+        "traditional",
+        "male",
+        "adult",
+        (309, 283, 252, 218, 182, 146, 114, 86, 63),
+    ),
+    (
+        "wa_field_24_blue_marked",
+        "flatbow",
+        "male",
+        "adult",
+        (273, 244, 212, 179, 146, 116, 90, 68, 51),
+    ),
+    (
+        "wa_field_24_blue_marked",
+        "longbow",
+        "male",
+        "adult",
+        _LONGBOW_MALE_ADULT_BLUE24,
+    ),
+    (
+        "wa_field_24_blue_marked",
+        "english longbow",
+        "male",
+        "adult",
+        _LONGBOW_MALE_ADULT_BLUE24,
+    ),
+)
+
+_CLASSIFICATION_CASES = (
+    (
+        "wa_field_24_red_marked",
+        400,
+        "adult",
+        "compound",
+        "GMB",
+    ),
+    (  # Bowman classifications only on 12-target rounds
+        "wa_field_12_red_marked",
+        200,
+        "adult",
+        "compound",
+        "B1",
+    ),
+    (  # Archer classifications only on shorter rounds - A1
+        "wa_field_24_blue_marked",
+        400,
+        "adult",
+        "compound",
+        "A1",
+    ),
+    (  # Archer classifications only on shorter rounds - A2
+        "wa_field_24_yellow_marked",
+        400,
+        "adult",
+        "compound",
+        "A2",
+    ),
+    (  # Archer classifications only on shorter rounds - A3
+        "wa_field_24_white_marked",
+        400,
+        "adult",
+        "compound",
+        "A3",
+    ),
+    (
+        "wa_field_24_red_marked",
+        337,
+        "50+",
+        "recurve",
+        "GMB",
+    ),
+    (
+        "wa_field_24_blue_marked",
+        306,
+        "under21",
+        "barebow",
+        "MB",
+    ),
+    (
+        "wa_field_24_red_marked",
+        306,
+        "under21",
+        "barebow",
+        "UC",
+    ),
+    (
+        "wa_field_24_blue_marked",
+        177,
+        "Under 18",
+        "traditional",
+        "B1",
+    ),
+    (
+        "wa_field_24_red_marked",
+        177,
+        "Under 18",
+        "traditional",
+        "UC",
+    ),
+    (  # Bowman classifications only on 12-target rounds
+        "wa_field_12_blue_marked",
+        88,
+        "Under 18",
+        "traditional",
+        "B1",
+    ),
+    (  # Archer classifications only on shorter rounds - Junior
+        "wa_field_24_yellow_marked",
+        400,
+        "Under 18",
+        "traditional",
+        "A1",
+    ),
+    (  # Archer classifications only on shorter rounds - Junior
+        "wa_field_24_white_marked",
+        400,
+        "Under 18",
+        "traditional",
+        "A2",
+    ),
+    (
+        "wa_field_24_blue_marked",
+        143,
+        "Under 12",
+        "flatbow",
+        "EMB",
+    ),
+    (
+        "wa_field_24_blue_marked",
+        96,
+        "Under 12",
+        "longbow",
+        "EMB",
+    ),
+    (
+        "wa_field_24_blue_marked",
+        1,
+        "Under 12",
+        "longbow",
+        "UC",
+    ),
+    (
+        "wa_field_24_blue_marked",
+        1,
+        "Under 12",
+        "english longbow",
+        "UC",
+    ),
 )
 
 
@@ -16,171 +256,33 @@ class TestAgbFieldClassificationScores:
     """Tests for the field classification scores function."""
 
     @pytest.mark.parametrize(
-        "roundname,age_group,scores_expected",
-        [
-            (
-                "wa_field_24_blue_marked",
-                "adult",
-                [336, 311, 283, 249, 212, 173, 135, 101, 74],
-            ),
-            (
-                "wa_field_24_blue_marked",
-                "50+",
-                [321, 294, 263, 227, 188, 149, 114, 84, 60],
-            ),
-            (
-                "wa_field_24_blue_marked",
-                "Under 21",
-                [336, 311, 283, 249, 212, 173, 135, 101, 74],
-            ),
-            (
-                "wa_field_24_blue_marked",
-                "Under 18",
-                [305, 275, 241, 203, 164, 127, 94, 68, 48],
-            ),
-            (
-                "wa_field_24_blue_marked",
-                "Under 12",
-                [224, 185, 146, 111, 82, 58, 41, 28, 19],
-            ),
+        "roundname,bowstyle,gender,age_group,scores_expected",
+        _SCORES_CASES,
+        ids=[
+            f"{roundname}-{bowstyle}-{gender}-{age_group}"
+            for roundname, bowstyle, gender, age_group, _ in _SCORES_CASES
         ],
     )
-    def test_agb_field_classification_scores_ages(
-        self,
-        roundname: str,
-        age_group: str,
-        scores_expected: list[int],
-    ) -> None:
-        """Check that field classification returns expected value for a case."""
-        scores = class_funcs.agb_field_classification_scores(
-            roundname=roundname,
-            bowstyle="barebow",
-            gender="male",
-            age_group=age_group,
-        )
-
-        assert scores == scores_expected
-
-    @pytest.mark.parametrize(
-        "roundname,gender,age_group,scores_expected",
-        [
-            (
-                "wa_field_24_blue_marked",
-                "male",
-                "adult",
-                [336, 311, 283, 249, 212, 173, 135, 101, 74],
-            ),
-            (
-                "wa_field_24_blue_marked",
-                "female",
-                "adult",
-                [315, 287, 255, 218, 179, 140, 106, 78, 55],
-            ),
-            (
-                "wa_field_24_blue_marked",
-                "male",
-                "Under 18",
-                [305, 275, 241, 203, 164, 127, 94, 68, 48],
-            ),
-            (
-                "wa_field_24_blue_marked",
-                "female",
-                "Under 18",
-                [280, 247, 209, 170, 132, 99, 72, 51, 35],
-            ),
-        ],
-    )
-    def test_agb_field_classification_scores_genders(
+    def test_agb_field_classification_scores(
         self,
         roundname: str,
+        bowstyle: str,
         gender: str,
         age_group: str,
-        scores_expected: list[int],
+        scores_expected: tuple[int, ...],
     ) -> None:
         """Check that field classification returns expected value for a case."""
         scores = class_funcs.agb_field_classification_scores(
             roundname=roundname,
-            bowstyle="barebow",
+            bowstyle=bowstyle,
             gender=gender,
             age_group=age_group,
         )
 
-        assert scores == scores_expected
-
-    @pytest.mark.parametrize(
-        "roundname,bowstyle,scores_expected",
-        # Check all systems, different distances, negative and large handicaps.
-        [
-            (
-                "wa_field_24_red_marked",
-                "compound",
-                [408, 391, 369, 345, 318, 286, 248, 204, 157],
-            ),
-            (
-                "wa_field_12_red_unmarked",
-                "compound",
-                [-9999, -9999, -9999, 173, 159, 143, 124, 102, 79],
-            ),
-            (
-                "wa_field_24_red_marked",
-                "compound limited",
-                [369, 347, 322, 293, 259, 219, 176, 133, 96],
-            ),
-            (
-                "wa_field_24_blue_marked",
-                "compound barebow",
-                [343, 321, 296, 268, 235, 200, 164, 129, 99],
-            ),
-            (
-                "wa_field_24_red_marked",
-                "recurve",
-                [369, 343, 314, 279, 237, 189, 139, 96, 62],
-            ),
-            (
-                "wa_field_24_blue_marked",
-                "barebow",
-                [336, 311, 283, 249, 212, 173, 135, 101, 74],
-            ),
-            (
-                "wa_field_24_blue_marked",
-                "traditional",
-                [309, 283, 252, 218, 182, 146, 114, 86, 63],
-            ),
-            (
-                "wa_field_24_blue_marked",
-                "flatbow",
-                [273, 244, 212, 179, 146, 116, 90, 68, 51],
-            ),
-            (
-                "wa_field_24_blue_marked",
-                "longbow",
-                [241, 209, 176, 143, 114, 88, 67, 49, 36],
-            ),
-            (
-                "wa_field_24_blue_marked",
-                "english longbow",
-                [241, 209, 176, 143, 114, 88, 67, 49, 36],
-            ),
-        ],
-    )
-    def test_agb_field_classification_scores_bowstyles(
-        self,
-        roundname: str,
-        bowstyle: str,
-        scores_expected: list[int],
-    ) -> None:
-        """Check that field classification returns expected value for a case."""
-        scores = class_funcs.agb_field_classification_scores(
-            roundname=roundname,
-            bowstyle=bowstyle,
-            gender="male",
-            age_group="adult",
-        )
-
-        assert scores == scores_expected
+        assert tuple(scores) == scores_expected
 
     @pytest.mark.parametrize(
-        "roundname,bowstyle,gender,age_group",
+        "roundname,bowstyle,gender,age_group,groupname_expected",
         # Check all systems, different distances, negative and large handicaps.
         [
             (
@@ -188,18 +290,21 @@ class TestAgbFieldClassificationScores:
                 "invalidbowstyle",
                 "male",
                 "adult",
+                "adult_male_invalidbowstyle",
             ),
             (
                 "wa_field_24_red_marked",
                 "recurve",
                 "invalidgender",
                 "adult",
+                "adult_invalidgender_recurve",
             ),
             (
                 "wa_field_24_blue_marked",
                 "barebow",
                 "male",
                 "invalidage",
+                "invalidage_male_barebow",
             ),
         ],
     )
@@ -209,15 +314,10 @@ class TestAgbFieldClassificationScores:
         bowstyle: str,
         gender: str,
         age_group: str,
+        groupname_expected: str,
     ) -> None:
         """Check that field classification returns expected value for a case."""
-        with pytest.raises(
-            KeyError,
-            match=(
-                f"{age_group.lower().replace(' ', '')}_"
-                f"{gender.lower()}_{bowstyle.lower()}"
-            ),
-        ):
+        with pytest.raises(KeyError) as excinfo:
             _ = class_funcs.agb_field_classification_scores(
                 roundname=roundname,
                 bowstyle=bowstyle,
@@ -225,132 +325,18 @@ class TestAgbFieldClassificationScores:
                 age_group=age_group,
             )
 
+        assert excinfo.value.args[0] == groupname_expected
+
 
 class TestCalculateAgbFieldClassification:
     """Tests for the field classification function."""
 
     @pytest.mark.parametrize(
         "roundname,score,age_group,bowstyle,class_expected",
-        [
-            (
-                "wa_field_24_red_marked",
-                400,
-                "adult",
-                "compound",
-                "GMB",
-            ),
-            (  # Bowman classifications only on 12-target rounds
-                "wa_field_12_red_marked",
-                200,
-                "adult",
-                "compound",
-                "B1",
-            ),
-            (  # Archer classifications only on shorter rounds - A1
-                "wa_field_24_blue_marked",
-                400,
-                "adult",
-                "compound",
-                "A1",
-            ),
-            (  # Archer classifications only on shorter rounds - A2
-                "wa_field_24_yellow_marked",
-                400,
-                "adult",
-                "compound",
-                "A2",
-            ),
-            (  # Archer classifications only on shorter rounds - A3
-                "wa_field_24_white_marked",
-                400,
-                "adult",
-                "compound",
-                "A3",
-            ),
-            (
-                "wa_field_24_red_marked",
-                337,
-                "50+",
-                "recurve",
-                "GMB",
-            ),
-            (
-                "wa_field_24_blue_marked",
-                306,
-                "under21",
-                "barebow",
-                "MB",
-            ),
-            (
-                "wa_field_24_red_marked",
-                306,
-                "under21",
-                "barebow",
-                "UC",
-            ),
-            (
-                "wa_field_24_blue_marked",
-                177,
-                "Under 18",
-                "traditional",
-                "B1",
-            ),
-            (
-                "wa_field_24_red_marked",
-                177,
-                "Under 18",
-                "traditional",
-                "UC",
-            ),
-            (  # Bowman classifications only on 12-target rounds
-                "wa_field_12_blue_marked",
-                88,
-                "Under 18",
-                "traditional",
-                "B1",
-            ),
-            (  # Archer classifications only on shorter rounds - Junior
-                "wa_field_24_yellow_marked",
-                400,
-                "Under 18",
-                "traditional",
-                "A1",
-            ),
-            (  # Archer classifications only on shorter rounds - Junior
-                "wa_field_24_white_marked",
-                400,
-                "Under 18",
-                "traditional",
-                "A2",
-            ),
-            (
-                "wa_field_24_blue_marked",
-                143,
-                "Under 12",
-                "flatbow",
-                "EMB",
-            ),
-            (
-                "wa_field_24_blue_marked",
-                96,
-                "Under 12",
-                "longbow",
-                "EMB",
-            ),
-            (
-                "wa_field_24_blue_marked",
-                1,
-                "Under 12",
-                "longbow",
-                "UC",
-            ),
-            (
-                "wa_field_24_blue_marked",
-                1,
-                "Under 12",
-                "english longbow",
-                "UC",
-            ),
+        _CLASSIFICATION_CASES,
+        ids=[
+            f"{roundname}-{score}-{age_group}-{bowstyle}"
+            for roundname, score, age_group, bowstyle, _ in _CLASSIFICATION_CASES
         ],
     )
     def test_calculate_agb_field_classification(
@@ -407,40 +393,15 @@ class TestCalculateAgbFieldClassification:
 
         assert class_returned == class_expected
 
-    @pytest.mark.parametrize(
-        "roundname,score",
-        [
-            (
-                "wa_field_24_blue_marked",
-                1000,
-            ),
-            (
-                "wa_field_24_blue_marked",
-                433,
-            ),
-            (
-                "wa_field_24_blue_marked",
-                -1,
-            ),
-            (
-                "wa_field_24_blue_marked",
-                -100,
-            ),
-        ],
-    )
+    @pytest.mark.parametrize("score", [1000, 433, -1, -100])
     def test_calculate_agb_field_classification_invalid_scores(
         self,
-        roundname: str,
         score: float,
+        agb_field_max_scores: dict[str, float],
     ) -> None:
         """Check that field classification fails for inappropriate scores."""
-        with pytest.raises(
-            ValueError,
-            match=(
-                f"Invalid score of {score} for a {roundname}. "
-                f"Should be in range 0-{ALL_AGBFIELD_ROUNDS[roundname].max_score()}."
-            ),
-        ):
+        roundname = "wa_field_24_blue_marked"
+        with pytest.raises(ValueError) as excinfo:
             _ = class_funcs.calculate_agb_field_classification(
                 score=score,
                 roundname=roundname,
@@ -448,3 +409,8 @@ class TestCalculateAgbFieldClassification:
                 gender="male",
                 age_group="adult",
             )
+
+        assert str(excinfo.value) == (
+            f"Invalid score of {score} for a {roundname}. "
+            f"Should be in range 0-{agb_field_max_scores[roundname]}."
+        )
@@ -1,14 +1,172 @@
 """Tests for old (pre-2025) agb field classification functions."""
 
+from typing import Final
+
 import pytest
 
 import archeryutils.classifications as class_funcs
-from archeryutils import load_rounds
 
-ALL_AGBFIELD_ROUNDS = load_rounds.read_json_to_round_dict(
-    [
-        "WA_field.json",
-    ],
+# Expected scores shared by several cases (old field scores do not depend on round)
+_BAREBOW_MALE_ADULT: Final = (328, 307, 279, 252, 224, 197)
+_BAREBOW_MALE_UNDER18: Final = (298, 279, 254, 229, 204, 179)
+_TRADITIONAL_MALE_ADULT: Final = (262, 245, 223, 202, 178, 157)
+_LONGBOW_MALE_ADULT: Final = (201, 188, 171, 155, 137, 121)
+
+# Check all ages, genders, and bowstyles.
+_SCORES_CASES = (
+    # Ages
+    (
+        "wa_field_24_blue_marked",
+        "barebow",
+        "male",
+        "adult",
+        _BAREBOW_MALE_ADULT,
+    ),
+    (
+        "wa_field_24_blue_marked",
+        "barebow",
+        "male",
+        "50+",
+        _BAREBOW_MALE_ADULT,
+    ),
+    (
+        "wa_field_24_blue_marked",
+        "barebow",
+        "male",
+        "under21",
+        _BAREBOW_MALE_ADULT,
+    ),
+    (
+        "wa_field_24_blue_marked",
+        "barebow",
+        "male",
+        "Under 18",
+        _BAREBOW_MALE_UNDER18,
+    ),
+    (
+        "wa_field_24_blue_marked",
+        "barebow",
+        "male",
+        "Under 12",
+        _BAREBOW_MALE_UNDER18,
+    ),
+    # Genders
+    (
+        "wa_field_24_blue_marked",
+        "barebow",
+        "female",
+        "adult",
+        (303, 284, 258, 233, 207, 182),
+    ),
+    (
+        "wa_field_24_blue_marked",
+        "barebow",
+        "female",
+        "Under 18",
+        (251, 236, 214, 193, 172, 151),
+    ),
+    # Bowstyles
+    (
+        "wa_field_24_red_marked",
+        "compound",
+        "male",
+        "adult",
+        (393, 377, 344, 312, 279, 247),
+    ),
+    (
+        "wa_field_24_red_marked",
+        "recurve",
+        "male",
+        "adult",
+        (338, 317, 288, 260, 231, 203),
+    ),
+    (
+        "wa_field_24_blue_marked",
+        "traditional",
+        "male",
+        "adult",
+        _TRADITIONAL_MALE_ADULT,
+    ),
+    (
+        "wa_field_24_blue_marked",
+        "flatbow",
+        "male",
+        "adult",
+        _TRADITIONAL_MALE_ADULT,
+    ),
+    (
+        "wa_field_24_blue_marked",
+        "longbow",
+        "male",
+        "adult",
+        _LONGBOW_MALE_ADULT,
+    ),
+    (
+        "wa_field_24_blue_marked",
+        "english longbow",
+        "male",
+        "adult",
+        _LONGBOW_MALE_ADULT,
+    ),
+)
+
+_CLASSIFICATION_CASES = (
+    (
+        "wa_field_24_red_marked",
+        400,
+        "adult",
+        "compound",
+        "GMB",
+    ),
+    (
+        "wa_field_24_red_marked",
+        337,
+        "50+",
+        "recurve",
+        "MB",
+    ),
+    (
+        "wa_field_24_blue_marked",
+        306,
+        "under21",
+        "barebow",
+        "B",
+    ),
+    (
+        "wa_field_24_blue_marked",
+        177,
+        "Under 18",
+        "traditional",
+        "1C",
+    ),
+    (
+        "wa_field_24_blue_marked",
+        143,
+        "Under 12",
+        "flatbow",
+        "2C",
+    ),
+    (
+        "wa_field_24_blue_marked",
+        96,
+        "Under 12",
+        "longbow",
+        "3C",
+    ),
+    (
+        "wa_field_24_blue_marked",
+        1,
+        "Under 12",
+        "longbow",
+        "UC",
+    ),
+    (
+        "wa_field_24_blue_marked",
+        1,
+        "Under 12",
+        "english longbow",
+        "UC",
+    ),
 )
 
 
@@ -16,156 +174,33 @@ class TestAgbOldFieldClassificationScores:
     """Tests for the field classification scores function."""
 
     @pytest.mark.parametrize(
-        "roundname,age_group,scores_expected",
-        [
-            (
-                "wa_field_24_blue_marked",
-                "adult",
-                [328, 307, 279, 252, 224, 197],
-            ),
-            (
-                "wa_field_24_blue_marked",
-                "50+",
-                [328, 307, 279, 252, 224, 197],
-            ),
-            (
-                "wa_field_24_blue_marked",
-                "under21",
-                [328, 307, 279, 252, 224, 197],
-            ),
-            (
-                "wa_field_24_blue_marked",
-                "Under 18",
-                [298, 279, 254, 229, 204, 179],
-            ),
-            (
-                "wa_field_24_blue_marked",
-                "Under 12",
-                [298, 279, 254, 229, 204, 179],
-            ),
-        ],
-    )
-    def test_agb_old_field_classification_scores_ages(
-        self,
-        roundname: str,
-        age_group: str,
-        scores_expected: list[int],
-    ) -> None:
-        """Check that field classification returns expected value for a case."""
-        scores = class_funcs.agb_old_field_classification_scores(
-            roundname=roundname,
-            bowstyle="barebow",
-            gender="male",
-            age_group=age_group,
-        )
-
-        assert scores == scores_expected
-
-    @pytest.mark.parametrize(
-        "roundname,gender,age_group,scores_expected",
-        [
-            (
-                "wa_field_24_blue_marked",
-                "male",
-                "adult",
-                [328, 307, 279, 252, 224, 197],
-            ),
-            (
-                "wa_field_24_blue_marked",
-                "female",
-                "adult",
-                [303, 284, 258, 233, 207, 182],
-            ),
-            (
-                "wa_field_24_blue_marked",
-                "male",
-                "Under 18",
-                [298, 279, 254, 229, 204, 179],
-            ),
-            (
-                "wa_field_24_blue_marked",
-                "female",
-                "Under 18",
-                [251, 236, 214, 193, 172, 151],
-            ),
+        "roundname,bowstyle,gender,age_group,scores_expected",
+        _SCORES_CASES,
+        ids=[
+            f"{roundname}-{bowstyle}-{gender}-{age_group}"
+            for roundname, bowstyle, gender, age_group, _ in _SCORES_CASES
         ],
     )
-    def test_agb_old_field_classification_scores_genders(
+    def test_agb_old_field_classification_scores(
         self,
         roundname: str,
+        bowstyle: str,
         gender: str,
         age_group: str,
-        scores_expected: list[int],
+        scores_expected: tuple[int, ...],
     ) -> None:
         """Check that field classification returns expected value for a case."""
         scores = class_funcs.agb_old_field_classification_scores(
             roundname=roundname,
-            bowstyle="barebow",
+            bowstyle=bowstyle,
             gender=gender,
             age_group=age_group,
         )
 
-        assert scores == scores_expected
+        assert tuple(scores) == scores_expected
 
     @pytest.mark.parametrize(
-        "roundname,bowstyle,scores_expected",
-        # Check all systems, different distances, negative and large handicaps.
-        [
-            (
-                "wa_field_24_red_marked",
-                "compound",
-                [393, 377, 344, 312, 279, 247],
-            ),
-            (
-                "wa_field_24_red_marked",
-                "recurve",
-                [338, 317, 288, 260, 231, 203],
-            ),
-            (
-                "wa_field_24_blue_marked",
-                "barebow",
-                [328, 307, 279, 252, 224, 197],
-            ),
-            (
-                "wa_field_24_blue_marked",
-                "traditional",
-                [262, 245, 223, 202, 178, 157],
-            ),
-            (
-                "wa_field_24_blue_marked",
-                "flatbow",
-                [262, 245, 223, 202, 178, 157],
-            ),
-            (
-                "wa_field_24_blue_marked",
-                "longbow",
-                [201, 188, 171, 155, 137, 121],
-            ),
-            (
-                "wa_field_24_blue_marked",
-                "english longbow",
-                [201, 188, 171, 155, 137, 121],
-            ),
-        ],
-    )
-    def test_agb_old_field_classification_scores_bowstyles(
-        self,
-        roundname: str,
-        bowstyle: str,
-        scores_expected: list[int],
-    ) -> None:
-        """Check that field classification returns expected value for a case."""
-        scores = class_funcs.agb_old_field_classification_scores(
-            roundname=roundname,
-            bowstyle=bowstyle,
-            gender="male",
-            age_group="adult",
-        )
-
-        assert scores == scores_expected
-
-    @pytest.mark.parametrize(
-        "roundname,bowstyle,gender,age_group",
+        "roundname,bowstyle,gender,age_group,groupname_expected",
         # Check all systems, different distances, negative and large handicaps.
         [
             (
@@ -173,18 +208,21 @@ class TestAgbOldFieldClassificationScores:
                 "invalidbowstyle",
                 "male",
                 "adult",
+                "adult_male_invalidbowstyle",
             ),
             (
                 "wa_field_24_red_marked",
                 "recurve",
                 "invalidgender",
                 "adult",
+                "adult_invalidgender_recurve",
             ),
             (
                 "wa_field_24_blue_marked",
                 "barebow",
                 "male",
                 "invalidage",
+                "invalidage_male_barebow",
             ),
         ],
     )
@@ -194,15 +232,10 @@ class TestAgbOldFieldClassificationScores:
         bowstyle: str,
         gender: str,
         age_group: str,
+        groupname_expected: str,
     ) -> None:
         """Check that field classification returns expected value for a case."""
-        with pytest.raises(
-            KeyError,
-            match=(
-                f"{age_group.lower().replace(' ', '')}_"
-                f"{gender.lower()}_{bowstyle.lower()}"
-            ),
-        ):
+        with pytest.raises(KeyError) as excinfo:
             _ = class_funcs.agb_old_field_classification_scores(
                 roundname=roundname,
                 bowstyle=bowstyle,
@@ -210,69 +243,18 @@ class TestAgbOldFieldClassificationScores:
                 age_group=age_group,
             )
 
+        assert excinfo.value.args[0] == groupname_expected
+
 
 class TestCalculateOldAgbFieldClassification:
     """Tests for the field classification function."""
 
     @pytest.mark.parametrize(
         "roundname,score,age_group,bowstyle,class_expected",
-        [
-            (
-                "wa_field_24_red_marked",
-                400,
-                "adult",
-                "compound",
-                "GMB",
-            ),
-            (
-                "wa_field_24_red_marked",
-                337,
-                "50+",
-                "recurve",
-                "MB",
-            ),
-            (
-                "wa_field_24_blue_marked",
-                306,
-                "under21",
-                "barebow",
-                "B",
-            ),
-            (
-                "wa_field_24_blue_marked",
-                177,
-                "Under 18",
-                "traditional",
-                "1C",
-            ),
-            (
-                "wa_field_24_blue_marked",
-                143,
-                "Under 12",
-                "flatbow",
-                "2C",
-            ),
-            (
-                "wa_field_24_blue_marked",
-                96,
-                "Under 12",
-                "longbow",
-                "3C",
-            ),
-            (
-                "wa_field_24_blue_marked",
-                1,
-                "Under 12",
-                "longbow",
-                "UC",
-            ),
-            (
-                "wa_field_24_blue_marked",
-                1,
-                "Under 12",
-                "english longbow",
-                "UC",
-            ),
+        _CLASSIFICATION_CASES,
+        ids=[
+            f"{roundname}-{score}-{age_group}-{bowstyle}"
+            for roundname, score, age_group, bowstyle, _ in _CLASSIFICATION_CASES
         ],
     )
     def test_calculate_agb_old_field_classification(
@@ -355,15 +337,10 @@ class TestCalculateOldAgbFieldClassification:
         self,
         roundname: str,
         score: float,
+        agb_field_max_scores: dict[str, float],
     ) -> None:
         """Check that field classification fails for inappropriate scores."""
-        with pytest.raises(
-            ValueError,
-            match=(
-                f"Invalid score of {score} for a {roundname}. "
-                f"Should be in range 0-{ALL_AGBFIELD_ROUNDS[roundname].max_score()}."
-            ),
-        ):
+        with pytest.raises(ValueError) as excinfo:
             _ = class_funcs.calculate_agb_old_field_classification(
                 score=score,
                 roundname=roundname,
@@ -371,3 +348,8 @@ class TestCalculateOldAgbFieldClassification:
                 gender="male",
                 age_group="adult",
             )
+
+        assert str(excinfo.value) == (
+            f"Invalid score of {score} for a {roundname}. "
+            f"Should be in range 0-{agb_field_max_scores[roundname]}."
+        )
@@ -3,48 +3,18 @@
 import pytest
 
 import archeryutils.classifications as class_funcs
-from archeryutils import load_rounds
-
-ALL_INDOOR_ROUNDS = load_rounds.read_json_to_round_dict(
-    [
-        "WA_indoor.json",
-        "AGB_indoor.json",
-    ],
-)
 
 
 class TestAgbOldIndoorClassificationScores:
     """Tests for the old_indoor classification scores function."""
 
     @pytest.mark.parametrize(
-        "age_group,scores_expected",
-        [
-            (
-                "adult",
-                [592, 582, 554, 505, 432, 315, 195, 139],
-            ),
-            (
-                "50+",
-                [592, 582, 554, 505, 432, 315, 195, 139],
-            ),
-            (
-                "under21",
-                [592, 582, 554, 505, 432, 315, 195, 139],
-            ),
-            (
-                "Under 18",
-                [592, 582, 554, 505, 432, 315, 195, 139],
-            ),
-            (
-                "Under 12",
-                [592, 582, 554, 505, 432, 315, 195, 139],
-            ),
-        ],
+        "age_group",
+        ["adult", "50+", "under21", "Under 18", "Under 12"],
     )
     def test_agb_old_indoor_classification_scores_ages(
         self,
         age_group: str,
-        scores_expected: list[int],
     ) -> None:
         """
         Check that old_indoor classification returns expected value for a case.
@@ -58,7 +28,7 @@ class TestAgbOldIndoorClassificationScores:
             age_group=age_group,
         )
 
-        assert scores == scores_expected
+        assert tuple(scores) == (592, 582, 554, 505, 432, 315, 195, 139)
 
     def test_agb_old_indoor_classification_scores_genders(
         self,
@@ -71,7 +41,7 @@ class TestAgbOldIndoorClassificationScores:
             age_group="adult",
         )
 
-        assert scores == [582, 569, 534, 479, 380, 255, 139, 93]
+        assert tuple(scores) == (582, 569, 534, 479, 380, 255, 139, 93)
 
     @pytest.mark.parametrize(
         "bowstyle,gender,scores_expected",
@@ -79,12 +49,12 @@ class TestAgbOldIndoorClassificationScores:
             (
                 "compound",
                 "male",
-                [581, 570, 554, 529, 484, 396, 279, 206],
+                (581, 570, 554, 529, 484, 396, 279, 206),
             ),
             (
                 "compound",
                 "female",
-                [570, 562, 544, 509, 449, 347, 206, 160],
+                (570, 562, 544, 509, 449, 347, 206, 160),
             ),
         ],
     )
@@ -92,7 +62,7 @@ class TestAgbOldIndoorClassificationScores:
         self,
         bowstyle: str,
         gender: str,
-        scores_expected: list[int],
+        scores_expected: tuple[int, ...],
     ) -> None:
         """
         Check that old_indoor classification returns expected value for a case.
@@ -106,7 +76,7 @@ class TestAgbOldIndoorClassificationScores:
             age_group="adult",
         )
 
-        assert scores == scores_expected
+        assert tuple(scores) == scores_expected
 
     def test_agb_old_indoor_classification_scores_gent_compound_worcester(
         self,
@@ -119,10 +89,10 @@ class TestAgbOldIndoorClassificationScores:
             age_group="adult",
         )
 
-        assert scores == [300, 299, 289, 264, 226, 162, 96, 65]
+        assert tuple(scores) == (300, 299, 289, 264, 226, 162, 96, 65)
 
     @pytest.mark.parametrize(
-        "bowstyle,gender,age_group",
+        "bowstyle,gender,age_group,groupname_expected",
         # Check all systems, different distances, negative and large handicaps.
         [
             # No invalid bowstyle as anything non-compound returns non-compound.
@@ -131,6 +101,7 @@ class TestAgbOldIndoorClassificationScores:
                 "recurve",
                 "invalidgender",
                 "adult",
+                "adult_invalidgender_recurve",
             ),
         ],
     )
@@ -139,15 +110,10 @@ class TestAgbOldIndoorClassificationScores:
         bowstyle: str,
         gender: str,
         age_group: str,
+        groupname_expected: str,
     ) -> None:
         """Check that old_indoor classification returns expected value for a case."""
-        with pytest.raises(
-            KeyError,
-            match=(
-                f"{age_group.lower().replace(' ', '')}_"
-                f"{gender.lower()}_{bowstyle.lower()}"
-            ),
-        ):
+        with pytest.raises(KeyError) as excinfo:
             _ = class_funcs.agb_old_indoor_classification_scores(
                 roundname="portsmouth",
                 bowstyle=bowstyle,
@@ -155,6 +121,8 @@ class TestAgbOldIndoorClassificationScores:
                 age_group=age_group,
             )
 
+        assert excinfo.value.args[0] == groupname_expected
+
 
 class TestCalculateAgbOldIndoorClassification:
     """Tests for the old_indoor classification function."""
@@ -241,15 +209,10 @@ class TestCalculateAgbOldIndoorClassification:
         self,
         roundname: str,
         score: float,
+        agb_indoor_max_scores: dict[str, float],
     ) -> None:
         """Check that old_indoor classification fails for inappropriate scores."""
-        with pytest.raises(
-            ValueError,
-            match=(
-                f"Invalid score of {score} for a {roundname}. "
-                f"Should be in range 0-{ALL_INDOOR_ROUNDS[roundname].max_score()}."
-            ),
-        ):
+        with pytest.raises(ValueError) as excinfo:
             _ = class_funcs.calculate_agb_old_indoor_classification(
                 score=score,
                 roundname=roundname,
@@ -257,3 +220,8 @@ class TestCalculateAgbOldIndoorClassification:
                 gender="male",
                 age_group="adult",
             )
+
+        assert str(excinfo.value) == (
+            f"Invalid score of {score} for a {roundname}. "
+            f"Should be in range 0-{agb_indoor_max_scores[roundname]}."
+        )
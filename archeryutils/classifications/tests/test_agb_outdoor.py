@@ -3,14 +3,181 @@
 import pytest
 
 import archeryutils.classifications as class_funcs
-from archeryutils import load_rounds
 
-ALL_OUTDOOR_ROUNDS = load_rounds.read_json_to_round_dict(
-    [
-        "AGB_outdoor_imperial.json",
-        "AGB_outdoor_metric.json",
-        "WA_outdoor.json",
-    ],
+# Check all ages, genders, and bowstyles across different rounds and distances.
+_SCORES_CASES = (
+    # Ages
+    (
+        "wa1440_90",
+        "recurve",
+        "male",
+        "adult",
+        (1320, 1266, 1197, 1110, 999, 866, 717, 566, 426),
+    ),
+    (
+        "wa1440_70",
+        "recurve",
+        "male",
+        "50+",
+        (1305, 1247, 1173, 1079, 960, 817, 659, 503, 364),
+    ),
+    (
+        "wa1440_90",
+        "recurve",
+        "male",
+        "under21",
+        (1270, 1203, 1117, 1008, 877, 728, 577, 435, 313),
+    ),
+    (
+        "wa1440_70",
+        "recurve",
+        "male",
+        "Under 18",
+        (1252, 1179, 1086, 969, 828, 671, 514, 373, 259),
+    ),
+    (
+        "wa1440_60",
+        "recurve",
+        "male",
+        "Under 16",
+        (1241, 1165, 1068, 946, 799, 635, 474, 335, 227),
+    ),
+    (
+        "metric_iii",
+        "recurve",
+        "male",
+        "Under 15",
+        (1261, 1191, 1101, 988, 849, 693, 534, 389, 270),
+    ),
+    (
+        "metric_iv",
+        "recurve",
+        "male",
+        "Under 14",
+        (1301, 1242, 1166, 1070, 952, 814, 666, 524, 396),
+    ),
+    (
+        "metric_v",
+        "recurve",
+        "male",
+        "Under 12",
+        (1317, 1263, 1193, 1104, 992, 858, 706, 550, 406),
+    ),
+    # Genders
+    (
+        "wa1440_70",
+        "recurve",
+        "female",
+        "adult",
+        (1316, 1261, 1191, 1101, 988, 849, 693, 536, 392),
+    ),
+    (
+        "metric_iii",
+        "recurve",
+        "female",
+        "Under 16",
+        (1274, 1207, 1122, 1014, 881, 727, 567, 418, 293),
+    ),
+    (
+        "metric_iii",
+        "recurve",
+        "female",
+        "Under 15",
+        (1261, 1191, 1101, 988, 849, 693, 534, 389, 270),
+    ),
+    (
+        "metric_v",
+        "recurve",
+        "female",
+        "Under 12",
+        (1317, 1263, 1193, 1104, 992, 858, 706, 550, 406),
+    ),
+    # Bowstyles
+    (
+        "wa1440_90",
+        "compound",
+        "male",
+        "adult",
+        (1389, 1362, 1327, 1283, 1229, 1162, 1081, 982, 866),
+    ),
+    (
+        "wa1440_70",
+        "compound",
+        "female",
+        "adult",
+        (1392, 1364, 1330, 1286, 1233, 1167, 1086, 988, 870),
+    ),
+    (
+        "wa1440_90",
+        "barebow",
+        "male",
+        "adult",
+        (1124, 1042, 945, 835, 717, 598, 484, 380, 290),
+    ),
+    (
+        "wa1440_70",
+        "barebow",
+        "female",
+        "adult",
+        (1108, 1023, 921, 806, 682, 558, 441, 338, 252),
+    ),
+    (
+        "wa1440_90",
+        "longbow",
+        "male",
+        "adult",
+        (825, 696, 566, 445, 337, 248, 177, 124, 85),
+    ),
+    (
+        "wa1440_70",
+        "longbow",
+        "female",
+        "adult",
+        (761, 625, 493, 373, 274, 195, 136, 94, 64),
+    ),
+    (
+        "wa1440_70",
+        "english longbow",
+        "female",
+        "adult",
+        (761, 625, 493, 373, 274, 195, 136, 94, 64),
+    ),
+    # Valid bowstyles that use another bowstyle's outdoor scores
+    (
+        "wa1440_90",
+        "flatbow",
+        "male",
+        "adult",
+        (1124, 1042, 945, 835, 717, 598, 484, 380, 290),
+    ),
+    (
+        "wa1440_70",
+        "traditional",
+        "female",
+        "adult",
+        (1108, 1023, 921, 806, 682, 558, 441, 338, 252),
+    ),
+    (
+        "wa1440_70",
+        "asiatic",
+        "female",
+        "adult",
+        (1108, 1023, 921, 806, 682, 558, 441, 338, 252),
+    ),
+    (
+        "wa1440_70",
+        "compound barebow",
+        "female",
+        "adult",
+        (1392, 1364, 1330, 1286, 1233, 1167, 1086, 988, 870),
+    ),
+    (
+        "wa1440_70",
+        "compound limited",
+        "female",
+        "adult",
+        (1392, 1364, 1330, 1286, 1233, 1167, 1086, 988, 870),
+    ),
 )
 
 
@@ -23,241 +190,44 @@ class TestAgbOutdoorClassificationScores:
     """
 
     @pytest.mark.parametrize(
-        "roundname,age_group,scores_expected",
-        [
-            (
-                "wa1440_90",
-                "adult",
-                [426, 566, 717, 866, 999, 1110, 1197, 1266, 1320],
-            ),
-            (
-                "wa1440_70",
-                "50+",
-                [364, 503, 659, 817, 960, 1079, 1173, 1247, 1305],
-            ),
-            (
-                "wa1440_90",
-                "under21",
-                [313, 435, 577, 728, 877, 1008, 1117, 1203, 1270],
-            ),
-            (
-                "wa1440_70",
-                "Under 18",
-                [259, 373, 514, 671, 828, 969, 1086, 1179, 1252],
-            ),
-            (
-                "wa1440_60",
-                "Under 16",
-                [227, 335, 474, 635, 799, 946, 1068, 1165, 1241],
-            ),
-            (
-                "metric_iii",
-                "Under 15",
-                [270, 389, 534, 693, 849, 988, 1101, 1191, 1261],
-            ),
-            (
-                "metric_iv",
-                "Under 14",
-                [396, 524, 666, 814, 952, 1070, 1166, 1242, 1301],
-            ),
-            (
-                "metric_v",
-                "Under 12",
-                [406, 550, 706, 858, 992, 1104, 1193, 1263, 1317],
-            ),
-        ],
-    )
-    def test_agb_outdoor_classification_scores_ages(
-        self,
-        roundname: str,
-        age_group: str,
-        scores_expected: list[int],
-    ) -> None:
-        """Check that  classification returns expected value for a case."""
-        scores = class_funcs.agb_outdoor_classification_scores(
-            roundname=roundname,
-            bowstyle="recurve",
-            gender="male",
-            age_group=age_group,
-        )
-
-        assert scores == scores_expected[::-1]
-
-    @pytest.mark.parametrize(
-        "roundname,age_group,scores_expected",
-        [
-            (
-                "wa1440_70",
-                "adult",
-                [392, 536, 693, 849, 988, 1101, 1191, 1261, 1316],
-            ),
-            (
-                "metric_iii",
-                "Under 16",
-                [293, 418, 567, 727, 881, 1014, 1122, 1207, 1274],
-            ),
-            (
-                "metric_iii",
-                "Under 15",
-                [270, 389, 534, 693, 849, 988, 1101, 1191, 1261],
-            ),
-            (
-                "metric_v",
-                "Under 12",
-                [406, 550, 706, 858, 992, 1104, 1193, 1263, 1317],
-            ),
-        ],
-    )
-    def test_agb_outdoor_classification_scores_genders(
-        self,
-        roundname: str,
-        age_group: str,
-        scores_expected: list[int],
-    ) -> None:
-        """
-        Check that outdoor classification returns expected value for a case.
-
-        Male equivalents already checked above.
-        Also checks that compound rounds are being enforced.
-        """
-        scores = class_funcs.agb_outdoor_classification_scores(
-            roundname=roundname,
-            bowstyle="recurve",
-            gender="female",
-            age_group=age_group,
-        )
-
-        assert scores == scores_expected[::-1]
-
-    @pytest.mark.parametrize(
-        "roundname,bowstyle,gender,scores_expected",
-        [
-            (
-                "wa1440_90",
-                "compound",
-                "male",
-                [866, 982, 1081, 1162, 1229, 1283, 1327, 1362, 1389],
-            ),
-            (
-                "wa1440_70",
-                "compound",
-                "female",
-                [870, 988, 1086, 1167, 1233, 1286, 1330, 1364, 1392],
-            ),
-            (
-                "wa1440_90",
-                "barebow",
-                "male",
-                [290, 380, 484, 598, 717, 835, 945, 1042, 1124],
-            ),
-            (
-                "wa1440_70",
-                "barebow",
-                "female",
-                [252, 338, 441, 558, 682, 806, 921, 1023, 1108],
-            ),
-            (
-                "wa1440_90",
-                "longbow",
-                "male",
-                [85, 124, 177, 248, 337, 445, 566, 696, 825],
-            ),
-            (
-                "wa1440_70",
-                "longbow",
-                "female",
-                [64, 94, 136, 195, 274, 373, 493, 625, 761],
-            ),
-            (
-                "wa1440_70",
-                "english longbow",
-                "female",
-                [64, 94, 136, 195, 274, 373, 493, 625, 761],
-            ),
+        "roundname,bowstyle,gender,age_group,scores_expected",
+        _SCORES_CASES,
+        ids=[
+            f"{roundname}-{bowstyle}-{gender}-{age_group}"
+            for roundname, bowstyle, gender, age_group, _ in _SCORES_CASES
         ],
     )
-    def test_agb_outdoor_classification_scores_bowstyles(
+    def test_agb_outdoor_classification_scores(
         self,
         roundname: str,
         bowstyle: str,
         gender: str,
-        scores_expected: list[int],
+        age_group: str,
+        scores_expected: tuple[int, ...],
     ) -> None:
         """Check that outdoor classification returns expected value for a case."""
         scores = class_funcs.agb_outdoor_classification_scores(
             roundname=roundname,
             bowstyle=bowstyle,
             gender=gender,
-            age_group="adult",
-        )
-
-        assert scores == scores_expected[::-1]
-
-    @pytest.mark.parametrize(
-        "roundname,bowstyle,gender,scores_expected",
-        [
-            (
-                "wa1440_90",
-                "flatbow",
-                "male",
-                [290, 380, 484, 598, 717, 835, 945, 1042, 1124],
-            ),
-            (
-                "wa1440_70",
-                "traditional",
-                "female",
-                [252, 338, 441, 558, 682, 806, 921, 1023, 1108],
-            ),
-            (
-                "wa1440_70",
-                "asiatic",
-                "female",
-                [252, 338, 441, 558, 682, 806, 921, 1023, 1108],
-            ),
-            (
-                "wa1440_70",
-                "compound barebow",
-                "female",
-                [870, 988, 1086, 1167, 1233, 1286, 1330, 1364, 1392],
-            ),
-            (
-                "wa1440_70",
-                "compound limited",
-                "female",
-                [870, 988, 1086, 1167, 1233, 1286, 1330, 1364, 1392],
-            ),
-        ],
-    )
-    def test_agb_outdoor_classification_scores_nonbowstyles(
-        self,
-        roundname: str,
-        bowstyle: str,
-        gender: str,
-        scores_expected: list[int],
-    ) -> None:
-        """Check that appropriate scores returned for valid non-outdoor bowstyles."""
-        scores = class_funcs.agb_outdoor_classification_scores(
-            roundname=roundname,
-            bowstyle=bowstyle,
-            gender=gender,
-            age_group="adult",
+            age_group=age_group,
         )
 
-        assert scores == scores_expected[::-1]
+        assert tuple(scores) == scores_expected
 
     @pytest.mark.parametrize(
         "roundname,scores_expected",
         [
             (
                 "wa1440_90_small",
-                [866, 982, 1081, 1162, 1229, 1283, 1327, 1362, 1389],
+                (1389, 1362, 1327, 1283, 1229, 1162, 1081, 982, 866),
             ),
         ],
     )
     def test_agb_outdoor_classification_scores_small_faces(
         self,
         roundname: str,
-        scores_expected: list[int],
+        scores_expected: tuple[int, ...],
     ) -> None:
         """
         Check that outdoor classification returns single face scores only.
@@ -271,10 +241,10 @@ class TestAgbOutdoorClassificationScores:
             age_group="adult",
         )
 
-        assert scores == scores_expected[::-1]
+        assert tuple(scores) == scores_expected
 
     @pytest.mark.parametrize(
-        "roundname,bowstyle,gender,age_group",
+        "roundname,bowstyle,gender,age_group,groupname_expected",
         # Check all systems, different distances, negative and large handicaps.
         [
             (
@@ -282,18 +252,21 @@ class TestAgbOutdoorClassificationScores:
                 "invalidbowstyle",
                 "male",
                 "adult",
+                "adult_male_invalidbowstyle",
             ),
             (
                 "wa1440_90",
                 "recurve",
                 "invalidgender",
                 "adult",
+                "adult_invalidgender_recurve",
             ),
             (
                 "wa1440_90",
                 "barebow",
                 "male",
                 "invalidage",
+                "invalidage_male_barebow",
             ),
         ],
     )
@@ -303,15 +276,10 @@ class TestAgbOutdoorClassificationScores:
         bowstyle: str,
         gender: str,
         age_group: str,
+        groupname_expected: str,
     ) -> None:
         """Check that outdoor classification returns expected value for a case."""
-        with pytest.raises(
-            KeyError,
-            match=(
-                f"{age_group.lower().replace(' ', '')}_"
-                f"{gender.lower()}_{bowstyle.lower()}"
-            ),
-        ):
+        with pytest.raises(KeyError) as excinfo:
             _ = class_funcs.agb_outdoor_classification_scores(
                 roundname=roundname,
                 bowstyle=bowstyle,
@@ -319,14 +287,13 @@ class TestAgbOutdoorClassificationScores:
                 age_group=age_group,
             )
 
+        assert excinfo.value.args[0] == groupname_expected
+
     def test_agb_outdoor_classification_scores_invalid_round(
         self,
     ) -> None:
         """Check that outdoor classification raises error for invalid round."""
-        with pytest.raises(
-            KeyError,
-            match=("invalid_roundname"),
-        ):
+        with pytest.raises(KeyError) as excinfo:
             _ = class_funcs.agb_outdoor_classification_scores(
                 roundname="invalid_roundname",
                 bowstyle="barebow",
@@ -334,6 +301,8 @@ class TestAgbOutdoorClassificationScores:
                 age_group="adult",
             )
 
+        assert excinfo.value.args[0] == "invalid_roundname"
+
 
 class TestCalculateAgbOutdoorClassification:
     """Tests for the outdoor classification function."""
@@ -505,6 +474,27 @@ class TestCalculateAgbOutdoorClassification:
                 "recurve",
                 "EMB",
             ),
+            (
+                "wa720_70",  # Unachievable MB tier not awarded for 0
+                0,
+                "adult",
+                "traditional",
+                "UC",
+            ),
+            (
+                "wa720_70",
+                0,
+                "adult",
+                "flatbow",
+                "UC",
+            ),
+            (
+                "wa720_70",
+                0,
+                "adult",
+                "compound barebow",
+                "UC",
+            ),
         ],
     )
     def test_calculate_agb_outdoor_classification_prestige_dist(
@@ -526,14 +516,54 @@ class TestCalculateAgbOutdoorClassification:
 
         assert class_returned == class_expected
 
+    @pytest.mark.parametrize(
+        "bowstyle,scoring_bowstyle",
+        [
+            ("traditional", "barebow"),
+            ("flatbow", "barebow"),
+            ("asiatic", "barebow"),
+            ("compound barebow", "compound"),
+        ],
+    )
+    @pytest.mark.parametrize(
+        "roundname,score,age_group",
+        [
+            ("wa720_50_b", 700, "adult"),  # Barebow prestige round
+            ("metric_80_40", 629, "Under 14"),  # Compound prestige round
+            ("wa720_70", 0, "adult"),
+        ],
+    )
+    def test_calculate_agb_outdoor_classification_bowstyle_aliases(
+        self,
+        roundname: str,
+        score: float,
+        age_group: str,
+        bowstyle: str,
+        scoring_bowstyle: str,
+    ) -> None:
+        """Check bowstyles using another's scores also use its prestige rounds."""
+        class_returned = class_funcs.calculate_agb_outdoor_classification(
+            roundname=roundname,
+            score=score,
+            bowstyle=bowstyle,
+            gender="male",
+            age_group=age_group,
+        )
+        class_expected = class_funcs.calculate_agb_outdoor_classification(
+            roundname=roundname,
+            score=score,
+            bowstyle=scoring_bowstyle,
+            gender="male",
+            age_group=age_group,
+        )
+
+        assert class_returned == class_expected
+
     def test_calculate_agb_outdoor_classification_invalid_round(
         self,
     ) -> None:
         """Check outdoor classification returns unclassified for inappropriate round."""
-        with pytest.raises(
-            KeyError,
-            match=("invalid_roundname"),
-        ):
+        with pytest.raises(KeyError) as excinfo:
             _ = class_funcs.calculate_agb_outdoor_classification(
                 roundname="invalid_roundname",
                 score=400,
@@ -542,19 +572,16 @@ class TestCalculateAgbOutdoorClassification:
                 age_group="adult",
             )
 
+        assert excinfo.value.args[0] == "invalid_roundname"
+
     @pytest.mark.parametrize("score", [3000, 1441, -1, -100])
     def test_calculate_agb_outdoor_classification_invalid_scores(
         self,
         score: float,
+        agb_outdoor_max_scores: dict[str, float],
     ) -> None:
         """Check that outdoor classification fails for inappropriate scores."""
-        with pytest.raises(
-            ValueError,
-            match=(
-                f"Invalid score of {score} for a wa1440_90. "
-                f"Should be in range 0-{ALL_OUTDOOR_ROUNDS['wa1440_90'].max_score()}."
-            ),
-        ):
+        with pytest.raises(ValueError) as excinfo:
             _ = class_funcs.calculate_agb_outdoor_classification(
                 score=score,
                 roundname="wa1440_90",
@@ -562,3 +589,8 @@ class TestCalculateAgbOutdoorClassification:
                 gender="male",
                 age_group="adult",
             )
+
+        assert str(excinfo.value) == (
+            f"Invalid score of {score} for a wa1440_90. "
+            f"Should be in range 0-{agb_outdoor_max_scores['wa1440_90']}."
+        )
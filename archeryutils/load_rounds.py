@@ -1,5 +1,6 @@
 """Module to load round data from json files into DotDicts."""
 
+import functools
 import json
 from pathlib import Path
 from typing import Any, Union
@@ -58,44 +59,30 @@ def read_json_to_round_dict(json_filelist: Union[str, list[str]]) -> dict[str, R
     if not isinstance(json_filelist, list):
         json_filelist = [json_filelist]
 
-    round_data_files = Path(__file__).parent.joinpath("round_data_files")
-
     round_dict = {}
 
     for json_file in json_filelist:
-        json_filepath = round_data_files.joinpath(json_file)
-        with open(json_filepath, encoding="utf-8") as json_round_file:
-            data = json.load(json_round_file)
-
-        for round_i in data:
+        for round_i in _read_round_data(json_file):
             # Assign location
             if "location" not in round_i:
-                round_i["location"] = None
-                round_i["indoor"] = False
+                location = None
+                indoor = False
 
             elif round_i["location"] in LOCATIONS["indoor"]:
-                round_i["indoor"] = True
-                round_i["location"] = "indoor"
+                indoor = True
+                location = "indoor"
 
             elif round_i["location"] in LOCATIONS["outdoor"]:
-                round_i["indoor"] = False
-                round_i["location"] = "outdoor"
+                indoor = False
+                location = "outdoor"
 
             elif round_i["location"] in LOCATIONS["field"]:
-                round_i["indoor"] = False
-                round_i["location"] = "field"
+                indoor = False
+                location = "field"
 
             else:
-                round_i["indoor"] = False
-                round_i["location"] = None
-
-            # Assign governing body
-            if "body" not in round_i:
-                round_i["body"] = None
-
-            # Assign round family
-            if "family" not in round_i:
-                round_i["family"] = None
+                indoor = False
+                location = None
 
             # Assign passes
             passes = [
@@ -104,22 +91,47 @@ def read_json_to_round_dict(json_filelist: Union[str, list[str]]) -> dict[str, R
                     pass_i["scoring"],
                     (pass_i["diameter"], pass_i.get("diameter_unit", "cm")),
                     (pass_i["distance"], pass_i["dist_unit"]),
-                    indoor=round_i["indoor"],
+                    indoor=indoor,
                 )
                 for pass_i in round_i["passes"]
             ]
 
+            # Governing body and round family are optional
             round_dict[round_i["codename"]] = Round(
                 round_i["name"],
                 passes,
-                location=round_i["location"],
-                body=round_i["body"],
-                family=round_i["family"],
+                location=location,
+                body=round_i.get("body"),
+                family=round_i.get("family"),
             )
 
     return round_dict
 
 
+@functools.lru_cache(maxsize=None)
+def _read_round_data(json_file: str) -> tuple[dict[str, Any], ...]:
+    """
+    Read and cache the raw round data from a json file.
+
+    The same files are loaded by several modules on import, so the parsed
+    contents are cached to avoid re-reading and decoding them each time.
+    Callers must not modify the returned data.
+
+    Parameters
+    ----------
+    json_file : str
+        filename of json round file in ./round_data_files/
+
+    Returns
+    -------
+    round_data : tuple of dict
+        raw round definitions as read from the json file
+    """
+    json_filepath = Path(__file__).parent.joinpath("round_data_files", json_file)
+    with open(json_filepath, encoding="utf-8") as json_round_file:
+        return tuple(json.load(json_round_file))
+
+
 class DotDict(dict[str, Any]):
     """
     A subclass of dict to provide dot notation access to a dictionary.